@@ -23,6 +23,7 @@ import json
 import re
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Union, Annotated, cast
 # from PIL import Image
 # from dotenv import load_dotenv
@@ -50,7 +51,7 @@ from langchain.agents import create_agent
 # Local Imports
 from database import SessionLocal
 from ollama_service import OllamaService, OllamaCloudWrapper
-from base import State, Answer, Context, ResponseFormat,
+from base import State, Answer, Context, ResponseFormat
 from logger_utils import log_info, log_error, log_debug, log_warning, logger
 # from llm_handler import get_model
 from tools import tools, init_sql_agent,trim_messages
@@ -1370,6 +1371,25 @@ ResponseFormat1 = {
 }
 
 
+@lru_cache(maxsize=256)
+def render_system_prompt(agent_prompt: str, current_date_str: str, employee_id: str, tool_intent_map: str) -> str:
+    """
+    Fill the per-tenant prompt template placeholders.
+    The same (tenant prompt, date, employee) combination repeats across a
+    conversation, so the rendered string is cached instead of rebuilding
+    it with a chain of replace() calls on every message.
+    """
+    current_year = datetime.now().year
+    previous_year = current_year - 1
+    rendered = agent_prompt
+    rendered = rendered.replace("{current_year}", str(current_year))
+    rendered = rendered.replace("{previous_year}", str(previous_year))
+    rendered = rendered.replace("{current_date_str}", current_date_str)
+    rendered = rendered.replace("{ID}", employee_id)
+    rendered = rendered.replace("{tool_intent_map}", tool_intent_map)
+    return rendered
+
+
 def process_message(message_content: str, conversation_id: str, tenant_id: str, employee_id: Optional[str] = None, push_name: str = "User"):
     # Fallback for employee_id
     if not employee_id:
@@ -1439,11 +1459,12 @@ def process_message(message_content: str, conversation_id: str, tenant_id: str,
     system_prompt = agent_prompt or fallback_prompt
     if agent_prompt:
         try:
-            system_prompt = system_prompt.replace("{current_year}", str(current_year))
-            system_prompt = system_prompt.replace("{previous_year}", str(previous_year))
-            system_prompt = system_prompt.replace("{current_date_str}", str(current_date_str))
-            system_prompt = system_prompt.replace("{ID}", str(employee_id))
-            system_prompt = system_prompt.replace("{tool_intent_map}", str(p_res[2] if p_res else tool_guide))
+            system_prompt = render_system_prompt(
+                agent_prompt,
+                str(current_date_str),
+                str(employee_id),
+                str(p_res[2] if p_res else tool_guide),
+            )
         except Exception as e:
                 logger.error(f"Error formatting prompt template: {e}")
                 system_prompt = agent_prompt
@@ -1,11 +1,13 @@
+import atexit
 import logging
+import queue
 import sys
 import os
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Logging setup
 logger = logging.getLogger("HR_AGENT")
-logger.propagate = True 
+logger.propagate = True
 
 LOG_DIR = "logs"
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -13,24 +15,38 @@ LOG_FILE = os.path.join(LOG_DIR, "chatbot.log")
 
 if not logger.handlers:
     logging.captureWarnings(True)
+    # Handlers that do real I/O sit behind a queue: a log call from the app is
+    # just a queue put, and a background listener thread does the formatting
+    # and stdout/file writes, so the event loop never blocks on logging.
+    _formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s:%(funcName)s:%(lineno)d - %(message)s")
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(_formatter)
+    _file_handler = RotatingFileHandler(LOG_FILE, maxBytes=5*1024*1024, backupCount=0, encoding="utf-8")
+    _file_handler.setFormatter(_formatter)
+
+    _log_queue = queue.Queue(-1)
+    _listener = QueueListener(_log_queue, _stream_handler, _file_handler, respect_handler_level=True)
+    _queue_handler = QueueHandler(_log_queue)
+    # Message-only on the producer side; the listener's handlers apply the
+    # real format (otherwise basicConfig's default formatter gets baked in)
+    _queue_handler.setFormatter(logging.Formatter("%(message)s"))
     logging.basicConfig(
         level=logging.DEBUG,
-        format="%(asctime)s [%(levelname)s] %(name)s:%(funcName)s:%(lineno)d - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            RotatingFileHandler(LOG_FILE, maxBytes=5*1024*1024, backupCount=0, encoding="utf-8"),
-        ],
+        handlers=[_queue_handler],
         force=True,
     )
+    _listener.start()
+    atexit.register(_listener.stop)
 
+# %-style args keep formatting lazy: nothing is built if the level is filtered
 def log_info(msg, tenant_id, conversation_id):
-    logger.info(f"[Tenant: {tenant_id} | Conversation: {conversation_id}] {msg}")
+    logger.info("[Tenant: %s | Conversation: %s] %s", tenant_id, conversation_id, msg)
 
 def log_error(msg, tenant_id, conversation_id):
-    logger.error(f"[Tenant: {tenant_id} | Conversation: {conversation_id}] {msg}")
+    logger.error("[Tenant: %s | Conversation: %s] %s", tenant_id, conversation_id, msg)
 
 def log_debug(msg, tenant_id, conversation_id):
-    logger.debug(f"[Tenant: {tenant_id} | Conversation: {conversation_id}] {msg}")
+    logger.debug("[Tenant: %s | Conversation: %s] %s", tenant_id, conversation_id, msg)
 
 def log_warning(msg, tenant_id, conversation_id):
-    logger.warning(f"[Tenant: {tenant_id} | Conversation: {conversation_id}] {msg}")
+    logger.warning("[Tenant: %s | Conversation: %s] %s", tenant_id, conversation_id, msg)
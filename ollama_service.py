@@ -1,4 +1,5 @@
 import httpx
+import io
 import json
 import logging
 import asyncio
@@ -505,20 +506,36 @@ class OllamaCloudWrapper:
             headers={'Authorization': f'Bearer {api_key}'}
         )
 
-    def invoke(self, prompt: str) -> str:
+    def invoke(self, prompt: str, stream: bool = False) -> str:
         """
         Standardized invoke method to match LangChain style.
+        Set stream=True to consume the chunked response as it arrives.
         """
         try:
             logger.info(f"Invoking {self.model_name} via {self.client._client.base_url}")
-            
+
+            if stream:
+                # Accumulate streamed fragments in a StringIO (C-backed growable
+                # buffer, O(n) amortized) and materialize the string once at the
+                # end; += on a str would re-copy the whole reply per chunk.
+                buf = io.StringIO()
+                for part in self.client.chat(
+                    model=self.model_name,
+                    messages=[{'role': 'user', 'content': prompt}],
+                    stream=True
+                ):
+                    chunk = part.get('message', {}).get('content', '')
+                    if chunk:
+                        buf.write(chunk)
+                return buf.getvalue()
+
             # Non-streaming call for a single block response
             response = self.client.chat(
                 model=self.model_name,
                 messages=[{'role': 'user', 'content': prompt}],
                 stream=False
             )
-            
+
             # Extract content safely
             content = response.get('message', {}).get('content', '')
             return content
@@ -0,0 +1,29 @@
+from fastapi import FastAPI, Request
+from pydantic import BaseModel
+import logging
+
+# Standalone power-grid monitor experiment. Lived at the bottom of main.py,
+# where its `app = FastAPI()` shadowed the chatbot app that uvicorn serves;
+# run it separately with `uvicorn power_monitor:app` if needed.
+
+# Log to a file so you can check it via SSH or Easypanel logs
+logging.basicConfig(
+    filename="power_monitor.log",
+    level=logging.INFO,
+    format="%(asctime)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+app = FastAPI()
+
+class PowerStatus(BaseModel):
+    status: str
+
+@app.post("/api/power/")
+async def power_update(data: PowerStatus, request: Request):
+    # Log the exact time and status
+    status_msg = f"Grid Status: {data.status.upper()} | Source: {request.client.host}"
+    logger.info(status_msg)
+    print(status_msg) # Visible in Easypanel container logs
+
+    return {"status": "received", "update": data.status}